@@ -63,36 +63,42 @@ class VirtualFileSystem:
         
         # 创建对应的Python版本工具
         self.python_tools = {
-            "servers/google_drive/getDocument.py": '''def get_document(document_id: str):
+            "servers/google_drive/getDocument.py": '''from mcp_server import get_document as mcp_get_document
+
+def get_document(document_id: str):
     """获取Google Drive文档"""
-    from mcp_server import get_document as mcp_get_document
     return mcp_get_document(document_id)
 ''',
-            "servers/google_drive/uploadFile.py": '''def upload_file(file_path: str, folder_id: str):
+            "servers/google_drive/uploadFile.py": '''from mcp_server import call_mcp_tool
+
+def upload_file(file_path: str, folder_id: str):
     """上传文件到Google Drive"""
-    from mcp_server import call_mcp_tool
-    return call_mcp_tool("google_drive", operation="upload_file", 
+    return call_mcp_tool("google_drive", operation="upload_file",
                          file_path=file_path, folder_id=folder_id)
 ''',
-            "servers/salesforce/updateRecord.py": '''def update_record(record_id: str, data: dict):
+            "servers/salesforce/updateRecord.py": '''from mcp_server import update_salesforce_record
+
+def update_record(record_id: str, data: dict):
     """更新Salesforce记录"""
-    from mcp_server import update_salesforce_record
     return update_salesforce_record(record_id, data)
 ''',
-            "servers/salesforce/queryRecords.py": '''def query_records(object_type: str, criteria: dict):
+            "servers/salesforce/queryRecords.py": '''from mcp_server import call_mcp_tool
+
+def query_records(object_type: str, criteria: dict):
     """查询Salesforce记录"""
-    from mcp_server import call_mcp_tool
-    return call_mcp_tool("salesforce", operation="query_records", 
+    return call_mcp_tool("salesforce", operation="query_records",
                          object_type=object_type, criteria=criteria)
 ''',
-            "servers/slack/sendMessage.py": '''def send_message(channel: str, message: str):
+            "servers/slack/sendMessage.py": '''from mcp_server import send_slack_message
+
+def send_message(channel: str, message: str):
     """发送Slack消息"""
-    from mcp_server import send_slack_message
     return send_slack_message(channel, message)
 ''',
-            "servers/slack/getMessages.py": '''def get_messages(channel: str):
+            "servers/slack/getMessages.py": '''from mcp_server import get_slack_messages
+
+def get_messages(channel: str):
     """获取Slack消息"""
-    from mcp_server import get_slack_messages
     return get_slack_messages(channel)
 '''
         }
@@ -1,5 +1,7 @@
 from transformers import AutoModelForCausalLM
 import torch
+# 只查询一次设备，后续直接复用
+device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 # 加载 Qwen 模型
 model_name = "Qwen/Qwen2.5-1.5B"
 qwen_model = AutoModelForCausalLM.from_pretrained(model_name)
@@ -7,10 +9,14 @@ qwen_model = AutoModelForCausalLM.from_pretrained(model_name)
 # 获取模型的 Transformer 层列表
 layers = qwen_model.model.layers  # 这是一个 torch.nn.ModuleList
 #print(layers)
-decoder_layer = qwen_model.model.layers[0]
+decoder_layer = qwen_model.model.layers[0].to(device)
 #print(decoder_layer)
+# 编译 decoder 层，让 Inductor 融合层内的逐元素算子
+decoder_layer = torch.compile(decoder_layer)
 #qwen_model=[]
-random_tensor = torch.randn(9, 6, 1536)
-aa=decoder_layer(random_tensor)
-aac=input()
+random_tensor = torch.randn(9, 6, 1536, device=device)
+# 推理模式下前向，省掉 autograd 的图构建开销
+qwen_model.eval()
+with torch.inference_mode():
+    aa=decoder_layer(random_tensor)
 print(aa[0].shape)
\ No newline at end of file